@@ -1,6 +1,8 @@
 import os
 import json
+import asyncio
 import re
+from functools import lru_cache
 from uuid import uuid4
 from typing import Optional
 
@@ -26,6 +28,13 @@ from agent.tools.sb_vision_tool import SandboxVisionTool
 from agent.gemini_prompt import get_gemini_system_prompt
 load_dotenv()
 
+@lru_cache(maxsize=1)
+def _load_sample_response() -> str:
+    """Read the sample assistant response shipped with the agent (cached after the first call)."""
+    sample_response_path = os.path.join(os.path.dirname(__file__), 'sample_responses/1.txt')
+    with open(sample_response_path, 'r', encoding='utf-8') as file:
+        return file.read()
+
 async def run_agent(
     thread_id: str,
     project_id: str,
@@ -79,9 +88,7 @@ async def run_agent(
         system_message = { "role": "system", "content": get_gemini_system_prompt() } # example included
     elif "anthropic" not in model_name.lower():
         # Only include sample response if the model name does not contain "anthropic"
-        sample_response_path = os.path.join(os.path.dirname(__file__), 'sample_responses/1.txt')
-        with open(sample_response_path, 'r') as file:
-            sample_response = file.read()
+        sample_response = _load_sample_response()
         
         system_message = { "role": "system", "content": get_system_prompt() + "\n\n <sample_assistant_response>" + sample_response + "</sample_assistant_response>" }
     else:
@@ -94,8 +101,12 @@ async def run_agent(
         iteration_count += 1
         logger.info(f"🔄 Running iteration {iteration_count} of {max_iterations}...")
 
-        # Billing check on each iteration - still needed within the iterations
-        can_run, message, subscription = await check_billing_status(client, account_id)
+        # Billing check on each iteration - still needed within the iterations.
+        # The latest-message lookup is independent, so run both queries concurrently.
+        (can_run, message, subscription), latest_message = await asyncio.gather(
+            check_billing_status(client, account_id),
+            client.table('messages').select('*').eq('thread_id', thread_id).in_('type', ['assistant', 'tool', 'user']).order('created_at', desc=True).limit(1).execute()
+        )
         if not can_run:
             error_msg = f"Billing limit reached: {message}"
             # Yield a special message to indicate billing limit reached
@@ -105,8 +116,7 @@ async def run_agent(
                 "message": error_msg
             }
             break
-        # Check if last message is from assistant using direct Supabase query
-        latest_message = await client.table('messages').select('*').eq('thread_id', thread_id).in_('type', ['assistant', 'tool', 'user']).order('created_at', desc=True).limit(1).execute()
+        # Check if last message is from assistant
         if latest_message.data and len(latest_message.data) > 0:
             message_type = latest_message.data[0].get('type')
             if message_type == 'assistant':
@@ -118,8 +128,11 @@ async def run_agent(
         temporary_message = None
         temp_message_content_list = [] # List to hold text/image blocks
 
-        # Get the latest browser_state message
-        latest_browser_state_msg = await client.table('messages').select('*').eq('thread_id', thread_id).eq('type', 'browser_state').order('created_at', desc=True).limit(1).execute()
+        # Get the latest browser_state and image_context messages concurrently
+        latest_browser_state_msg, latest_image_context_msg = await asyncio.gather(
+            client.table('messages').select('*').eq('thread_id', thread_id).eq('type', 'browser_state').order('created_at', desc=True).limit(1).execute(),
+            client.table('messages').select('*').eq('thread_id', thread_id).eq('type', 'image_context').order('created_at', desc=True).limit(1).execute()
+        )
         if latest_browser_state_msg.data and len(latest_browser_state_msg.data) > 0:
             try:
                 browser_content = json.loads(latest_browser_state_msg.data[0]["content"])
@@ -159,8 +172,7 @@ async def run_agent(
             except Exception as e:
                 logger.error(f"Error parsing browser state: {e}")
 
-        # Get the latest image_context message (NEW)
-        latest_image_context_msg = await client.table('messages').select('*').eq('thread_id', thread_id).eq('type', 'image_context').order('created_at', desc=True).limit(1).execute()
+        # Handle the latest image_context message (NEW)
         if latest_image_context_msg.data and len(latest_image_context_msg.data) > 0:
             try:
                 image_context_content = json.loads(latest_image_context_msg.data[0]["content"])
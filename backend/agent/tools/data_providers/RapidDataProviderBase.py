@@ -11,6 +11,10 @@ class EndpointSchema(TypedDict):
     payload: Dict[str, Any]
 
 
+# Shared by all providers so repeated calls reuse pooled keep-alive connections
+_session = requests.Session()
+
+
 class RapidDataProviderBase:
     def __init__(self, base_url: str, endpoints: Dict[str, EndpointSchema]):
         self.base_url = base_url
@@ -53,9 +57,9 @@ class RapidDataProviderBase:
         method = endpoint.get('method', 'GET').upper()
         
         if method == 'GET':
-            response = requests.get(url, params=payload, headers=headers)
+            response = _session.get(url, params=payload, headers=headers)
         elif method == 'POST':
-            response = requests.post(url, json=payload, headers=headers)
+            response = _session.post(url, json=payload, headers=headers)
         else:
             raise ValueError(f"Unsupported HTTP method: {method}")
         return response.json()
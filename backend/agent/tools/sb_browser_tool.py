@@ -1,5 +1,7 @@
 import traceback
 import json
+import shlex
+from urllib.parse import urlencode
 
 from agentpress.tool import ToolResult, openapi_schema, xml_schema
 from agentpress.thread_manager import ThreadManager
@@ -33,15 +35,16 @@ class SandboxBrowserTool(SandboxToolsBase):
             # Build the curl command
             url = f"http://localhost:8003/api/automation/{endpoint}"
             
+            # Quote every argument: params carry LLM-supplied text (URLs, typed
+            # input, search queries) that may contain quotes or shell metacharacters
             if method == "GET" and params:
-                query_params = "&".join([f"{k}={v}" for k, v in params.items()])
-                url = f"{url}?{query_params}"
-                curl_cmd = f"curl -s -X {method} '{url}' -H 'Content-Type: application/json'"
+                url = f"{url}?{urlencode(params)}"
+                curl_cmd = f"curl -s -X {method} {shlex.quote(url)} -H 'Content-Type: application/json'"
             else:
-                curl_cmd = f"curl -s -X {method} '{url}' -H 'Content-Type: application/json'"
+                curl_cmd = f"curl -s -X {method} {shlex.quote(url)} -H 'Content-Type: application/json'"
                 if params:
                     json_data = json.dumps(params)
-                    curl_cmd += f" -d '{json_data}'"
+                    curl_cmd += f" -d {shlex.quote(json_data)}"
             
             logger.debug("\033[95mExecuting curl command:\033[0m")
             logger.debug(f"{curl_cmd}")
@@ -93,8 +96,6 @@ class SandboxBrowserTool(SandboxToolsBase):
                         success_response["elements_found"] = result["element_count"]
                     if result.get("pixels_below"):
                         success_response["scrollable_content"] = result["pixels_below"] > 0
-                    if result.get("ocr_text"):
-                        success_response["ocr_text"] = result["ocr_text"]
                     if result.get("image_url"):
                         success_response["image_url"] = result["image_url"]
 
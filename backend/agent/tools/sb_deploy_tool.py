@@ -97,13 +97,14 @@ class SandboxDeployTool(SandboxToolsBase):
                     
                 # Single command that creates the project if it doesn't exist and then deploys
                 project_name = f"{self.sandbox_id}-{name}"
-                deploy_cmd = f'''cd {self.workspace_path} && export CLOUDFLARE_API_TOKEN={self.cloudflare_api_token} && 
+                deploy_cmd = f'''export CLOUDFLARE_API_TOKEN={self.cloudflare_api_token} && 
                     (npx wrangler pages deploy {full_path} --project-name {project_name} || 
                     (npx wrangler pages project create {project_name} --production-branch production && 
                     npx wrangler pages deploy {full_path} --project-name {project_name}))'''
 
-                # Execute the command directly using the sandbox's process.exec method
-                response = self.sandbox.process.exec(deploy_cmd, timeout=300)
+                # Execute the command directly using the sandbox's process.exec method,
+                # letting the sandbox set the working directory instead of a `cd` prefix
+                response = self.sandbox.process.exec(deploy_cmd, cwd=self.workspace_path, timeout=300)
                 
                 print(f"Deployment command output: {response.result}")
                 
@@ -11,7 +11,6 @@ class SandboxFilesTool(SandboxToolsBase):
 
     def __init__(self, project_id: str, thread_manager: ThreadManager):
         super().__init__(project_id, thread_manager)
-        self.SNIPPET_LINES = 4  # Number of context lines to show around edits
         self.workspace_path = "/workspace"  # Ensure we're always operating in /workspace
 
     def clean_path(self, path: str) -> str:
@@ -192,23 +191,17 @@ class SandboxFilesTool(SandboxToolsBase):
             old_str = old_str.expandtabs()
             new_str = new_str.expandtabs()
             
-            occurrences = content.count(old_str)
-            if occurrences == 0:
+            index = content.find(old_str)
+            if index == -1:
                 return self.fail_response(f"String '{old_str}' not found in file")
-            if occurrences > 1:
+            if content.find(old_str, index + 1) != -1:
                 lines = [i+1 for i, line in enumerate(content.split('\n')) if old_str in line]
                 return self.fail_response(f"Multiple occurrences found in lines {lines}. Please ensure string is unique")
             
-            # Perform replacement
-            new_content = content.replace(old_str, new_str)
+            # Perform replacement by splicing at the single match
+            new_content = content[:index] + new_str + content[index + len(old_str):]
             self.sandbox.fs.upload_file(full_path, new_content.encode())
             
-            # Show snippet around the edit
-            replacement_line = content.split(old_str)[0].count('\n')
-            start_line = max(0, replacement_line - self.SNIPPET_LINES)
-            end_line = replacement_line + self.SNIPPET_LINES + new_str.count('\n')
-            snippet = '\n'.join(new_content.split('\n')[start_line:end_line + 1])
-            
             # Get preview URL if it's an HTML file
             # preview_url = self._get_preview_url(file_path)
             message = f"Replacement successful."
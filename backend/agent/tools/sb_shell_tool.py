@@ -1,4 +1,5 @@
 from typing import Optional, Dict, Any
+import asyncio
 import time
 from uuid import uuid4
 from agentpress.tool import ToolResult, openapi_schema, xml_schema
@@ -9,29 +10,54 @@ class SandboxShellTool(SandboxToolsBase):
     """Tool for executing tasks in a Daytona sandbox with browser-use capabilities. 
     Uses sessions for maintaining state between commands and provides comprehensive process management."""
 
+    # Upper bound on captured pane output returned to the agent; the tail is kept
+    MAX_OUTPUT_CHARS = 50000
+    # Printed by batched tmux commands when the target session doesn't exist
+    SESSION_MISSING_MARKER = "__session_not_found__"
+
     def __init__(self, project_id: str, thread_manager: ThreadManager):
         super().__init__(project_id, thread_manager)
         self._sessions: Dict[str, str] = {}  # Maps session names to session IDs
         self.workspace_path = "/workspace"  # Ensure we're always operating in /workspace
+        # Keeps parallel first calls from each creating (and leaking) a session
+        self._session_lock = asyncio.Lock()
 
     async def _ensure_session(self, session_name: str = "default") -> str:
         """Ensure a session exists and return its ID."""
-        if session_name not in self._sessions:
-            session_id = str(uuid4())
-            try:
-                await self._ensure_sandbox()  # Ensure sandbox is initialized
-                self.sandbox.process.create_session(session_id)
-                self._sessions[session_name] = session_id
-            except Exception as e:
-                raise RuntimeError(f"Failed to create session: {str(e)}")
+        if session_name in self._sessions:
+            return self._sessions[session_name]
+
+        async with self._session_lock:
+            # Another call may have created the session while we waited
+            if session_name not in self._sessions:
+                session_id = str(uuid4())
+                try:
+                    await self._ensure_sandbox()  # Ensure sandbox is initialized
+                    await asyncio.to_thread(self.sandbox.process.create_session, session_id)
+                    self._sessions[session_name] = session_id
+                except Exception as e:
+                    raise RuntimeError(f"Failed to create session: {str(e)}")
         return self._sessions[session_name]
 
+    def _cap_output(self, result: Dict[str, Any], output: str) -> None:
+        """Store output in result, keeping only the tail if it exceeds MAX_OUTPUT_CHARS."""
+        dropped = len(output) - self.MAX_OUTPUT_CHARS
+        if dropped > 0:
+            output = f"[... {dropped} earlier characters truncated ...]\n" + output[-self.MAX_OUTPUT_CHARS:]
+            result["truncated"] = True
+            result["chars_dropped"] = dropped
+        result["output"] = output
+
+    def _session_missing(self, output: str) -> bool:
+        """Check whether a batched tmux command reported a missing session."""
+        return output.rstrip().endswith(self.SESSION_MISSING_MARKER)
+
     async def _cleanup_session(self, session_name: str):
         """Clean up a session if it exists."""
         if session_name in self._sessions:
             try:
                 await self._ensure_sandbox()  # Ensure sandbox is initialized
-                self.sandbox.process.delete_session(self._sessions[session_name])
+                await asyncio.to_thread(self.sandbox.process.delete_session, self._sessions[session_name])
                 del self._sessions[session_name]
             except Exception as e:
                 print(f"Warning: Failed to cleanup session {session_name}: {str(e)}")
@@ -126,13 +152,10 @@ class SandboxShellTool(SandboxToolsBase):
             if not session_name:
                 session_name = f"session_{str(uuid4())[:8]}"
             
-            # Check if tmux session already exists
-            check_session = await self._execute_raw_command(f"tmux has-session -t {session_name} 2>/dev/null || echo 'not_exists'")
-            session_exists = "not_exists" not in check_session.get("output", "")
-            
-            if not session_exists:
-                # Create a new tmux session
-                await self._execute_raw_command(f"tmux new-session -d -s {session_name}")
+            # Create the tmux session unless it already exists, in a single round-trip
+            await self._execute_raw_command(
+                f"tmux has-session -t {session_name} 2>/dev/null || tmux new-session -d -s {session_name}"
+            )
                 
             # Ensure we're in the correct directory and send command to tmux
             full_command = f"cd {cwd} && {command}"
@@ -143,19 +166,21 @@ class SandboxShellTool(SandboxToolsBase):
             
             if blocking:
                 # For blocking execution, wait and capture output
+                final_output = None
                 start_time = time.time()
                 while (time.time() - start_time) < timeout:
                     # Wait a bit before checking
-                    time.sleep(2)
+                    await asyncio.sleep(2)
                     
-                    # Check if session still exists (command might have exited)
-                    check_result = await self._execute_raw_command(f"tmux has-session -t {session_name} 2>/dev/null || echo 'ended'")
-                    if "ended" in check_result.get("output", ""):
-                        break
-                        
-                    # Get current output and check for common completion indicators
-                    output_result = await self._execute_raw_command(f"tmux capture-pane -t {session_name} -p -S - -E -")
+                    # Get current output; capture-pane fails once the session is gone,
+                    # so a single call also tells us whether the command exited
+                    output_result = await self._execute_raw_command(
+                        f"tmux capture-pane -t {session_name} -p -S - -E - 2>/dev/null || echo '{self.SESSION_MISSING_MARKER}'"
+                    )
                     current_output = output_result.get("output", "")
+                    if self._session_missing(current_output):
+                        break
+                    final_output = current_output
                     
                     # Check for prompt indicators that suggest command completion
                     last_lines = current_output.split('\n')[-3:]
@@ -163,19 +188,21 @@ class SandboxShellTool(SandboxToolsBase):
                     if any(indicator in line for indicator in completion_indicators for line in last_lines):
                         break
                 
-                # Capture final output
-                output_result = await self._execute_raw_command(f"tmux capture-pane -t {session_name} -p -S - -E -")
-                final_output = output_result.get("output", "")
+                # Capture final output unless the loop already has a fresh snapshot
+                if final_output is None:
+                    output_result = await self._execute_raw_command(f"tmux capture-pane -t {session_name} -p -S - -E -")
+                    final_output = output_result.get("output", "")
                 
                 # Kill the session after capture
                 await self._execute_raw_command(f"tmux kill-session -t {session_name}")
                 
-                return self.success_response({
-                    "output": final_output,
+                result = {
                     "session_name": session_name,
                     "cwd": cwd,
                     "completed": True
-                })
+                }
+                self._cap_output(result, final_output)
+                return self.success_response(result)
             else:
                 # For non-blocking, just return immediately
                 return self.success_response({
@@ -207,13 +234,17 @@ class SandboxShellTool(SandboxToolsBase):
             cwd=self.workspace_path
         )
         
-        response = self.sandbox.process.execute_session_command(
+        # The Daytona SDK is synchronous; run it in a worker thread so a slow
+        # sandbox round-trip doesn't stall other tool calls on the event loop
+        response = await asyncio.to_thread(
+            self.sandbox.process.execute_session_command,
             session_id=session_id,
             req=req,
             timeout=30  # Short timeout for utility commands
         )
         
-        logs = self.sandbox.process.get_session_command_logs(
+        logs = await asyncio.to_thread(
+            self.sandbox.process.get_session_command_logs,
             session_id=session_id,
             command_id=response.cmd_id
         )
@@ -268,27 +299,27 @@ class SandboxShellTool(SandboxToolsBase):
             # Ensure sandbox is initialized
             await self._ensure_sandbox()
             
-            # Check if session exists
-            check_result = await self._execute_raw_command(f"tmux has-session -t {session_name} 2>/dev/null || echo 'not_exists'")
-            if "not_exists" in check_result.get("output", ""):
-                return self.fail_response(f"Tmux session '{session_name}' does not exist.")
-            
-            # Get output from tmux pane
-            output_result = await self._execute_raw_command(f"tmux capture-pane -t {session_name} -p -S - -E -")
+            # Capture the pane (and kill the session if requested) in a single call;
+            # capture-pane fails when the session doesn't exist
+            command = f"tmux capture-pane -t {session_name} -p -S - -E - 2>/dev/null || echo '{self.SESSION_MISSING_MARKER}'"
+            if kill_session:
+                command += f"; tmux kill-session -t {session_name} 2>/dev/null"
+            output_result = await self._execute_raw_command(command)
             output = output_result.get("output", "")
+            if self._session_missing(output):
+                return self.fail_response(f"Tmux session '{session_name}' does not exist.")
             
-            # Kill session if requested
             if kill_session:
-                await self._execute_raw_command(f"tmux kill-session -t {session_name}")
                 termination_status = "Session terminated."
             else:
                 termination_status = "Session still running."
             
-            return self.success_response({
-                "output": output,
+            result = {
                 "session_name": session_name,
                 "status": termination_status
-            })
+            }
+            self._cap_output(result, output)
+            return self.success_response(result)
                 
         except Exception as e:
             return self.fail_response(f"Error checking command output: {str(e)}")
@@ -328,14 +359,13 @@ class SandboxShellTool(SandboxToolsBase):
             # Ensure sandbox is initialized
             await self._ensure_sandbox()
             
-            # Check if session exists
-            check_result = await self._execute_raw_command(f"tmux has-session -t {session_name} 2>/dev/null || echo 'not_exists'")
-            if "not_exists" in check_result.get("output", ""):
+            # Kill the session; kill-session itself fails if it doesn't exist
+            result = await self._execute_raw_command(
+                f"tmux kill-session -t {session_name} 2>/dev/null || echo '{self.SESSION_MISSING_MARKER}'"
+            )
+            if self._session_missing(result.get("output", "")):
                 return self.fail_response(f"Tmux session '{session_name}' does not exist.")
             
-            # Kill the session
-            await self._execute_raw_command(f"tmux kill-session -t {session_name}")
-            
             return self.success_response({
                 "message": f"Tmux session '{session_name}' terminated successfully."
             })
@@ -368,7 +398,7 @@ class SandboxShellTool(SandboxToolsBase):
             await self._ensure_sandbox()
             
             # List all tmux sessions
-            result = await self._execute_raw_command("tmux list-sessions 2>/dev/null || echo 'No sessions'")
+            result = await self._execute_raw_command("tmux list-sessions -F '#{session_name}' 2>/dev/null || echo 'No sessions'")
             output = result.get("output", "")
             
             if "No sessions" in output or not output.strip():
@@ -377,14 +407,8 @@ class SandboxShellTool(SandboxToolsBase):
                     "sessions": []
                 })
             
-            # Parse session list
-            sessions = []
-            for line in output.split('\n'):
-                if line.strip():
-                    parts = line.split(':')
-                    if parts:
-                        session_name = parts[0].strip()
-                        sessions.append(session_name)
+            # One session name per line
+            sessions = [line.strip() for line in output.splitlines() if line.strip()]
             
             return self.success_response({
                 "message": f"Found {len(sessions)} active sessions.",
@@ -8,12 +8,18 @@ from sandbox.tool_base import SandboxToolsBase
 from agentpress.thread_manager import ThreadManager
 import json
 
+# Supported image extensions and their MIME types
+IMAGE_MIME_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+}
+
 # Add common image MIME types if mimetypes module is limited
-mimetypes.add_type("image/webp", ".webp")
-mimetypes.add_type("image/jpeg", ".jpg")
-mimetypes.add_type("image/jpeg", ".jpeg")
-mimetypes.add_type("image/png", ".png")
-mimetypes.add_type("image/gif", ".gif")
+for _ext, _mime_type in IMAGE_MIME_TYPES.items():
+    mimetypes.add_type(_mime_type, _ext)
 
 # Maximum file size in bytes (e.g., 5MB)
 MAX_IMAGE_SIZE = 10 * 1024 * 1024
@@ -90,11 +96,8 @@ class SandboxVisionTool(SandboxToolsBase):
             if not mime_type or not mime_type.startswith('image/'):
                 # Basic fallback based on extension if mimetypes fails
                 ext = os.path.splitext(cleaned_path)[1].lower()
-                if ext == '.jpg' or ext == '.jpeg': mime_type = 'image/jpeg'
-                elif ext == '.png': mime_type = 'image/png'
-                elif ext == '.gif': mime_type = 'image/gif'
-                elif ext == '.webp': mime_type = 'image/webp'
-                else:
+                mime_type = IMAGE_MIME_TYPES.get(ext)
+                if not mime_type:
                     return self.fail_response(f"Unsupported or unknown image format for file: '{cleaned_path}'. Supported: JPG, PNG, GIF, WEBP.")
 
             # Prepare the temporary message content
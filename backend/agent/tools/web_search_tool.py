@@ -10,6 +10,7 @@ import os
 import datetime
 import asyncio
 import logging
+from uuid import uuid4
 
 # TODO: add subpages, etc... in filters as sometimes its necessary 
 
@@ -247,9 +248,7 @@ class SandboxWebSearchTool(SandboxToolsBase):
             
             logging.info(f"Processing {len(url_list)} URLs: {url_list}")
             
-            # Process each URL and collect results
-            results = []
-            for url in url_list:
+            async def process_url(url: str) -> dict:
                 try:
                     # Add protocol if missing
                     if not (url.startswith('http://') or url.startswith('https://')):
@@ -257,16 +256,19 @@ class SandboxWebSearchTool(SandboxToolsBase):
                         logging.info(f"Added https:// protocol to URL: {url}")
                     
                     # Scrape this URL
-                    result = await self._scrape_single_url(url)
-                    results.append(result)
+                    return await self._scrape_single_url(url, client)
                     
                 except Exception as e:
                     logging.error(f"Error processing URL {url}: {str(e)}")
-                    results.append({
+                    return {
                         "url": url,
                         "success": False,
                         "error": str(e)
-                    })
+                    }
+            
+            # Scrape all URLs concurrently over one connection pool; results keep the input order
+            async with httpx.AsyncClient() as client:
+                results = await asyncio.gather(*(process_url(url) for url in url_list))
             
             # Summarize results
             successful = sum(1 for r in results if r.get("success", False))
@@ -301,55 +303,55 @@ class SandboxWebSearchTool(SandboxToolsBase):
             logging.error(f"Error in scrape_webpage: {error_message}")
             return self.fail_response(f"Error processing scrape request: {error_message[:200]}")
     
-    async def _scrape_single_url(self, url: str) -> dict:
+    async def _scrape_single_url(self, url: str, client: httpx.AsyncClient) -> dict:
         """
         Helper function to scrape a single URL and return the result information.
+        The HTTP client is shared by all URLs of a scrape_webpage call.
         """
         logging.info(f"Scraping single URL: {url}")
         
         try:
             # ---------- Firecrawl scrape endpoint ----------
             logging.info(f"Sending request to Firecrawl for URL: {url}")
-            async with httpx.AsyncClient() as client:
-                headers = {
-                    "Authorization": f"Bearer {self.firecrawl_api_key}",
-                    "Content-Type": "application/json",
-                }
-                payload = {
-                    "url": url,
-                    "formats": ["markdown"]
-                }
-                
-                # Use longer timeout and retry logic for more reliability
-                max_retries = 3
-                timeout_seconds = 120
-                retry_count = 0
-                
-                while retry_count < max_retries:
-                    try:
-                        logging.info(f"Sending request to Firecrawl (attempt {retry_count + 1}/{max_retries})")
-                        response = await client.post(
-                            f"{self.firecrawl_url}/v1/scrape",
-                            json=payload,
-                            headers=headers,
-                            timeout=timeout_seconds,
-                        )
-                        response.raise_for_status()
-                        data = response.json()
-                        logging.info(f"Successfully received response from Firecrawl for {url}")
-                        break
-                    except (httpx.ReadTimeout, httpx.ConnectTimeout, httpx.ReadError) as timeout_err:
-                        retry_count += 1
-                        logging.warning(f"Request timed out (attempt {retry_count}/{max_retries}): {str(timeout_err)}")
-                        if retry_count >= max_retries:
-                            raise Exception(f"Request timed out after {max_retries} attempts with {timeout_seconds}s timeout")
-                        # Exponential backoff
-                        logging.info(f"Waiting {2 ** retry_count}s before retry")
-                        await asyncio.sleep(2 ** retry_count)
-                    except Exception as e:
-                        # Don't retry on non-timeout errors
-                        logging.error(f"Error during scraping: {str(e)}")
-                        raise e
+            headers = {
+                "Authorization": f"Bearer {self.firecrawl_api_key}",
+                "Content-Type": "application/json",
+            }
+            payload = {
+                "url": url,
+                "formats": ["markdown"]
+            }
+            
+            # Use longer timeout and retry logic for more reliability
+            max_retries = 3
+            timeout_seconds = 120
+            retry_count = 0
+            
+            while retry_count < max_retries:
+                try:
+                    logging.info(f"Sending request to Firecrawl (attempt {retry_count + 1}/{max_retries})")
+                    response = await client.post(
+                        f"{self.firecrawl_url}/v1/scrape",
+                        json=payload,
+                        headers=headers,
+                        timeout=timeout_seconds,
+                    )
+                    response.raise_for_status()
+                    data = response.json()
+                    logging.info(f"Successfully received response from Firecrawl for {url}")
+                    break
+                except (httpx.ReadTimeout, httpx.ConnectTimeout, httpx.ReadError) as timeout_err:
+                    retry_count += 1
+                    logging.warning(f"Request timed out (attempt {retry_count}/{max_retries}): {str(timeout_err)}")
+                    if retry_count >= max_retries:
+                        raise Exception(f"Request timed out after {max_retries} attempts with {timeout_seconds}s timeout")
+                    # Exponential backoff
+                    logging.info(f"Waiting {2 ** retry_count}s before retry")
+                    await asyncio.sleep(2 ** retry_count)
+                except Exception as e:
+                    # Don't retry on non-timeout errors
+                    logging.error(f"Error during scraping: {str(e)}")
+                    raise e
 
             # Format the response
             title = data.get("data", {}).get("metadata", {}).get("title", "")
@@ -377,7 +379,9 @@ class SandboxWebSearchTool(SandboxToolsBase):
             
             # Clean up domain for filename
             domain = "".join([c if c.isalnum() else "_" for c in domain])
-            safe_filename = f"{timestamp}_{domain}.json"
+            # URLs are scraped concurrently, so add a short suffix to keep pages
+            # from the same domain in the same second from overwriting each other
+            safe_filename = f"{timestamp}_{domain}_{uuid4().hex[:6]}.json"
             
             logging.info(f"Generated filename: {safe_filename}")
             
@@ -12,6 +12,7 @@ import json
 import asyncio
 import re
 import uuid
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple, AsyncGenerator, Callable, Union, Literal
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -28,6 +29,18 @@ XmlAddingStrategy = Literal["user_message", "assistant_message", "inline_edit"]
 # Type alias for tool execution strategy
 ToolExecutionStrategy = Literal["sequential", "parallel"]
 
+# Tag name at the start of an XML tool call chunk
+XML_TAG_NAME_PATTERN = re.compile(r'<([^\s>]+)')
+
+@lru_cache(maxsize=None)
+def _attribute_patterns(attr_name: str) -> Tuple[re.Pattern, ...]:
+    """Compiled patterns for an attribute value, in lookup order."""
+    return (
+        re.compile(fr'{attr_name}="([^"]*)"'),  # Double quotes
+        re.compile(fr"{attr_name}='([^']*)'"),  # Single quotes
+        re.compile(fr'{attr_name}=([^\s/>;]+)')  # No quotes - fixed escape sequence
+    )
+
 @dataclass
 class ToolExecutionContext:
     """Context for a tool execution including call details, result, and display info."""
@@ -81,6 +94,10 @@ class ProcessorConfig:
 class ResponseProcessor:
     """Processes LLM responses, extracting and executing tool calls."""
     
+    # Upper bound on tool calls running at once, whether started during
+    # streaming or by the "parallel" strategy
+    MAX_PARALLEL_TOOLS = 8
+    
     def __init__(self, tool_registry: ToolRegistry, add_message_callback: Callable):
         """Initialize the ResponseProcessor.
         
@@ -91,6 +108,11 @@ class ResponseProcessor:
         """
         self.tool_registry = tool_registry
         self.add_message = add_message_callback
+        # Combined start-tag pattern for the registered XML tools, rebuilt when they change
+        self._xml_tag_names: Tuple[str, ...] = ()
+        self._xml_tag_pattern: Optional[re.Pattern] = None
+        # Shared by every tool execution of this processor
+        self._tool_semaphore = asyncio.Semaphore(self.MAX_PARALLEL_TOOLS)
         
     async def process_streaming_response(
         self,
@@ -838,21 +860,16 @@ class ResponseProcessor:
     def _extract_attribute(self, opening_tag: str, attr_name: str) -> Optional[str]:
         """Extract attribute value from opening tag."""
         try:
-            # Handle both single and double quotes with raw strings
-            patterns = [
-                fr'{attr_name}="([^"]*)"',  # Double quotes
-                fr"{attr_name}='([^']*)'",  # Single quotes
-                fr'{attr_name}=([^\s/>;]+)'  # No quotes - fixed escape sequence
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, opening_tag)
+            # Handle both single and double quotes
+            for pattern in _attribute_patterns(attr_name):
+                match = pattern.search(opening_tag)
                 if match:
                     value = match.group(1)
-                    # Unescape common XML entities
-                    value = value.replace('&quot;', '"').replace('&apos;', "'")
-                    value = value.replace('&lt;', '<').replace('&gt;', '>')
-                    value = value.replace('&amp;', '&')
+                    # Unescape common XML entities (every entity starts with '&')
+                    if '&' in value:
+                        value = value.replace('&quot;', '"').replace('&apos;', "'")
+                        value = value.replace('&lt;', '<').replace('&gt;', '>')
+                        value = value.replace('&amp;', '&')
                     return value
             
             return None
@@ -861,28 +878,33 @@ class ResponseProcessor:
             logger.error(f"Error extracting attribute: {e}")
             return None
 
+    def _get_xml_tag_pattern(self) -> Optional[re.Pattern]:
+        """Get a single regex matching the opening of any registered XML tool tag."""
+        tag_names = tuple(self.tool_registry.xml_tools.keys())
+        if tag_names != self._xml_tag_names:
+            self._xml_tag_names = tag_names
+            # Longest names first so a tag never matches as a prefix of a longer one
+            alternatives = '|'.join(re.escape(name) for name in sorted(tag_names, key=len, reverse=True))
+            self._xml_tag_pattern = re.compile(f'<({alternatives})') if tag_names else None
+        return self._xml_tag_pattern
+
     def _extract_xml_chunks(self, content: str) -> List[str]:
         """Extract complete XML chunks using start and end pattern matching."""
         chunks = []
         pos = 0
         
         try:
+            tag_pattern = self._get_xml_tag_pattern()
+            if tag_pattern is None:
+                return chunks
+            
             while pos < len(content):
-                # Find the next tool tag
-                next_tag_start = -1
-                current_tag = None
-                
-                # Find the earliest occurrence of any registered tag
-                for tag_name in self.tool_registry.xml_tools.keys():
-                    start_pattern = f'<{tag_name}'
-                    tag_pos = content.find(start_pattern, pos)
-                    
-                    if tag_pos != -1 and (next_tag_start == -1 or tag_pos < next_tag_start):
-                        next_tag_start = tag_pos
-                        current_tag = tag_name
-                
-                if next_tag_start == -1 or not current_tag:
+                # Find the earliest occurrence of any registered tag in one scan
+                tag_match = tag_pattern.search(content, pos)
+                if not tag_match:
                     break
+                next_tag_start = tag_match.start()
+                current_tag = tag_match.group(1)
                 
                 # Find the matching end tag
                 end_pattern = f'</{current_tag}>'
@@ -936,7 +958,7 @@ class ResponseProcessor:
         """
         try:
             # Extract tag name and validate
-            tag_match = re.match(r'<([^\s>]+)', xml_chunk)
+            tag_match = XML_TAG_NAME_PATTERN.match(xml_chunk)
             if not tag_match:
                 logger.error(f"No tag found in XML chunk: {xml_chunk}")
                 return None
@@ -968,12 +990,14 @@ class ResponseProcessor:
             }
             # ---
             
+            # Attributes all live on the root opening tag; slice it out once
+            opening_tag = xml_chunk.split('>', 1)[0]
+            
             # Process each mapping
             for mapping in schema.mappings:
                 try:
                     if mapping.node_type == "attribute":
                         # Extract attribute from opening tag
-                        opening_tag = remaining_chunk.split('>', 1)[0]
                         value = self._extract_attribute(opening_tag, mapping.param_name)
                         if value is not None:
                             params[mapping.param_name] = value
@@ -1071,17 +1095,15 @@ class ResponseProcessor:
                 except json.JSONDecodeError:
                     arguments = {"text": arguments}
             
-            # Get available functions from tool registry
-            available_functions = self.tool_registry.get_available_functions()
-            
-            # Look up the function by name
-            tool_fn = available_functions.get(function_name)
+            # Look up the function by name in the tool registry
+            tool_fn = self.tool_registry.get_function(function_name)
             if not tool_fn:
                 logger.error(f"Tool function '{function_name}' not found in registry")
                 return ToolResult(success=False, output=f"Tool function '{function_name}' not found")
             
             logger.debug(f"Found tool function for '{function_name}', executing...")
-            result = await tool_fn(**arguments)
+            async with self._tool_semaphore:
+                result = await tool_fn(**arguments)
             logger.info(f"Tool execution complete: {function_name} -> {result}")
             return result
         except Exception as e:
@@ -1168,8 +1190,10 @@ class ResponseProcessor:
     async def _execute_tools_in_parallel(self, tool_calls: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], ToolResult]]:
         """Execute tool calls in parallel and return results.
         
-        This method executes all tool calls simultaneously using asyncio.gather, which
+        This method executes tool calls concurrently using asyncio.gather, which
         can significantly improve performance when executing multiple independent tools.
+        At most MAX_PARALLEL_TOOLS calls run at once (see _execute_tool) so a large
+        batch doesn't flood the sandbox with simultaneous requests.
         
         Args:
             tool_calls: List of tool calls to execute
@@ -217,8 +217,10 @@ Note that spaces for string values are not stripped. The output is parsed with r
 
 Here are the XML tools available with examples:
 """
-                for tag_name, example in xml_examples.items():
-                    examples_content += f"<{tag_name}> Example: {example}\\n"
+                examples_content += "".join(
+                    f"<{tag_name}> Example: {example}\\n"
+                    for tag_name, example in xml_examples.items()
+                )
 
                 # # Save examples content to a file
                 # try:
@@ -21,7 +21,7 @@ class SchemaType(Enum):
     XML = "xml"
     CUSTOM = "custom"
 
-@dataclass
+@dataclass(slots=True)
 class XMLNodeMapping:
     """Maps an XML node to a function parameter.
     
@@ -108,6 +108,10 @@ class Tool(ABC):
         fail_response: Create a failed result
     """
     
+    # Decorated-method schemas per tool class; they depend only on the class
+    # definition, so the member scan runs once per class, not per instance
+    _class_schemas: Dict[type, Dict[str, List[ToolSchema]]] = {}
+
     def __init__(self):
         """Initialize tool with empty schema registry."""
         self._schemas: Dict[str, List[ToolSchema]] = {}
@@ -116,10 +120,17 @@ class Tool(ABC):
 
     def _register_schemas(self):
         """Register schemas from all decorated methods."""
-        for name, method in inspect.getmembers(self, predicate=inspect.ismethod):
-            if hasattr(method, 'tool_schemas'):
-                self._schemas[name] = method.tool_schemas
-                logger.debug(f"Registered schemas for method '{name}' in {self.__class__.__name__}")
+        cls = self.__class__
+        class_schemas = Tool._class_schemas.get(cls)
+        if class_schemas is None:
+            class_schemas = {}
+            # Scan the class rather than the instance so properties aren't evaluated
+            for name, func in inspect.getmembers(cls, predicate=inspect.isfunction):
+                if hasattr(func, 'tool_schemas'):
+                    class_schemas[name] = func.tool_schemas
+                    logger.debug(f"Registered schemas for method '{name}' in {cls.__name__}")
+            Tool._class_schemas[cls] = class_schemas
+        self._schemas.update(class_schemas)
 
     def get_schemas(self) -> Dict[str, List[ToolSchema]]:
         """Get all registered tool schemas.
@@ -17,6 +17,7 @@ class ToolRegistry:
         register_tool: Register a tool with optional function filtering
         get_tool: Get a specific tool by name
         get_xml_tool: Get a tool by XML tag name
+        get_function: Get a tool function by name
         get_openapi_schemas: Get OpenAPI schemas for function calling
         get_xml_examples: Get examples of XML tool usage
     """
@@ -25,6 +26,10 @@ class ToolRegistry:
         """Initialize a new ToolRegistry instance."""
         self.tools = {}
         self.xml_tools = {}
+        # Derived from the registered tools; reset whenever a tool is registered
+        self._openapi_schemas: Optional[List[Dict[str, Any]]] = None
+        self._available_functions: Optional[Dict[str, Callable]] = None
+        self._xml_examples: Optional[Dict[str, str]] = None
         logger.debug("Initialized new ToolRegistry instance")
     
     def register_tool(self, tool_class: Type[Tool], function_names: Optional[List[str]] = None, **kwargs):
@@ -40,6 +45,9 @@ class ToolRegistry:
             - Handles both OpenAPI and XML schema registration
         """
         logger.debug(f"Registering tool class: {tool_class.__name__}")
+        self._openapi_schemas = None
+        self._available_functions = None
+        self._xml_examples = None
         tool_instance = tool_class(**kwargs)
         schemas = tool_instance.get_schemas()
         
@@ -76,24 +84,42 @@ class ToolRegistry:
         Returns:
             Dict mapping function names to their implementations
         """
-        available_functions = {}
+        available_functions = dict(self._get_function_map())
+        logger.debug(f"Retrieved {len(available_functions)} available functions")
+        return available_functions
+
+    def get_function(self, function_name: str) -> Optional[Callable]:
+        """Get a tool function by name.
         
-        # Get OpenAPI tool functions
-        for tool_name, tool_info in self.tools.items():
-            tool_instance = tool_info['instance']
-            function_name = tool_name
-            function = getattr(tool_instance, function_name)
-            available_functions[function_name] = function
+        Args:
+            function_name: Name of the tool function
+            
+        Returns:
+            The bound tool method, or None if not registered
+        """
+        return self._get_function_map().get(function_name)
+
+    def _get_function_map(self) -> Dict[str, Callable]:
+        """Build (once per registration change) the function name -> method map."""
+        if self._available_functions is None:
+            available_functions = {}
             
-        # Get XML tool functions
-        for tag_name, tool_info in self.xml_tools.items():
-            tool_instance = tool_info['instance']
-            method_name = tool_info['method']
-            function = getattr(tool_instance, method_name)
-            available_functions[method_name] = function
+            # Get OpenAPI tool functions
+            for tool_name, tool_info in self.tools.items():
+                tool_instance = tool_info['instance']
+                function_name = tool_name
+                function = getattr(tool_instance, function_name)
+                available_functions[function_name] = function
+                
+            # Get XML tool functions
+            for tag_name, tool_info in self.xml_tools.items():
+                tool_instance = tool_info['instance']
+                method_name = tool_info['method']
+                function = getattr(tool_instance, method_name)
+                available_functions[method_name] = function
             
-        logger.debug(f"Retrieved {len(available_functions)} available functions")
-        return available_functions
+            self._available_functions = available_functions
+        return self._available_functions
 
     def get_tool(self, tool_name: str) -> Dict[str, Any]:
         """Get a specific tool by name.
@@ -129,13 +155,14 @@ class ToolRegistry:
         Returns:
             List of OpenAPI-compatible schema definitions
         """
-        schemas = [
-            tool_info['schema'].schema 
-            for tool_info in self.tools.values()
-            if tool_info['schema'].schema_type == SchemaType.OPENAPI
-        ]
-        logger.debug(f"Retrieved {len(schemas)} OpenAPI schemas")
-        return schemas
+        if self._openapi_schemas is None:
+            self._openapi_schemas = [
+                tool_info['schema'].schema 
+                for tool_info in self.tools.values()
+                if tool_info['schema'].schema_type == SchemaType.OPENAPI
+            ]
+        logger.debug(f"Retrieved {len(self._openapi_schemas)} OpenAPI schemas")
+        return list(self._openapi_schemas)
 
     def get_xml_examples(self) -> Dict[str, str]:
         """Get all XML tag examples.
@@ -143,10 +170,12 @@ class ToolRegistry:
         Returns:
             Dict mapping tag names to their example usage
         """
-        examples = {}
-        for tool_info in self.xml_tools.values():
-            schema = tool_info['schema']
-            if schema.xml_schema and schema.xml_schema.example:
-                examples[schema.xml_schema.tag_name] = schema.xml_schema.example
-        logger.debug(f"Retrieved {len(examples)} XML examples")
-        return examples
+        if self._xml_examples is None:
+            examples = {}
+            for tool_info in self.xml_tools.values():
+                schema = tool_info['schema']
+                if schema.xml_schema and schema.xml_schema.example:
+                    examples[schema.xml_schema.tag_name] = schema.xml_schema.example
+            self._xml_examples = examples
+        logger.debug(f"Retrieved {len(self._xml_examples)} XML examples")
+        return dict(self._xml_examples)
@@ -1,4 +1,5 @@
 import os
+import re
 import urllib.parse
 from typing import Optional
 
@@ -15,6 +16,9 @@ from services.supabase import DBConnection
 router = APIRouter(tags=["sandbox"])
 db = None
 
+# Python-style Unicode escapes (e.g. \u0308) that may appear in request paths
+UNICODE_ESCAPE_PATTERN = re.compile(r'\\u([0-9a-fA-F]{4})')
+
 def initialize(_db: DBConnection):
     """Initialize the sandbox API with resources from the main API."""
     global db
@@ -48,14 +52,10 @@ def normalize_path(path: str) -> str:
         try:
             # Replace Python-style Unicode escapes (\u0308) with actual characters
             # This handles cases where the Unicode escape sequence is part of the URL
-            import re
-            unicode_pattern = re.compile(r'\\u([0-9a-fA-F]{4})')
-            
-            def replace_unicode(match):
-                hex_val = match.group(1)
-                return chr(int(hex_val, 16))
-            
-            decoded_path = unicode_pattern.sub(replace_unicode, decoded_path)
+            if '\\u' in decoded_path:
+                decoded_path = UNICODE_ESCAPE_PATTERN.sub(
+                    lambda match: chr(int(match.group(1), 16)), decoded_path
+                )
         except Exception as unicode_err:
             logger.warning(f"Error processing Unicode escapes in path '{path}': {str(unicode_err)}")
         
@@ -107,7 +107,10 @@ async def verify_sandbox_access(client, sandbox_id: str, user_id: Optional[str]
 
 async def get_sandbox_by_id_safely(client, sandbox_id: str):
     """
-    Safely retrieve a sandbox object by its ID, using the project that owns it.
+    Safely retrieve a sandbox object by its ID.
+    
+    Callers must run verify_sandbox_access first; it already confirms that a
+    project owns this sandbox, so the project is not looked up again here.
     
     Args:
         client: The Supabase client
@@ -117,18 +120,8 @@ async def get_sandbox_by_id_safely(client, sandbox_id: str):
         Sandbox: The sandbox object
         
     Raises:
-        HTTPException: If the sandbox doesn't exist or can't be retrieved
+        HTTPException: If the sandbox can't be retrieved
     """
-    # Find the project that owns this sandbox
-    project_result = await client.table('projects').select('project_id').filter('sandbox->>id', 'eq', sandbox_id).execute()
-    
-    if not project_result.data or len(project_result.data) == 0:
-        logger.error(f"No project found for sandbox ID: {sandbox_id}")
-        raise HTTPException(status_code=404, detail="Sandbox not found - no project owns this sandbox ID")
-    
-    # project_id = project_result.data[0]['project_id']
-    # logger.debug(f"Found project {project_id} for sandbox {sandbox_id}")
-    
     try:
         # Get the sandbox
         sandbox = await get_or_start_sandbox(sandbox_id)
@@ -614,8 +614,8 @@ class BrowserAutomation:
                 pixels_below=0
             )
     
-    async def take_screenshot(self) -> str:
-        """Take a screenshot and return as base64 encoded string"""
+    async def take_screenshot_bytes(self) -> bytes:
+        """Take a screenshot and return the raw JPEG bytes"""
         try:
             page = await self.get_current_page()
             
@@ -637,12 +637,12 @@ class BrowserAutomation:
                 scale='device'  # Use device scale factor
             )
             
-            return base64.b64encode(screenshot_bytes).decode('utf-8')
+            return screenshot_bytes
         except Exception as e:
             print(f"Error taking screenshot: {e}")
             traceback.print_exc()
-            # Return an empty string rather than failing
-            return ""
+            # Return empty bytes rather than failing
+            return b""
     
     async def save_screenshot_to_file(self) -> str:
         """Take a screenshot and save to file, returning the path"""
@@ -659,18 +659,20 @@ class BrowserAutomation:
             print(f"Error saving screenshot: {e}")
             return ""
     
-    async def extract_ocr_text_from_screenshot(self, screenshot_base64: str) -> str:
-        """Extract text from screenshot using OCR"""
-        if not screenshot_base64:
+    async def extract_ocr_text_from_screenshot(self, screenshot_bytes: bytes) -> str:
+        """Extract text from raw screenshot bytes using OCR"""
+        if not screenshot_bytes:
             return ""
             
-        try:
-            # Decode base64 to image
-            image_bytes = base64.b64decode(screenshot_base64)
-            image = Image.open(io.BytesIO(image_bytes))
+        def run_ocr() -> str:
+            image = Image.open(io.BytesIO(screenshot_bytes))
             
             # Extract text using pytesseract
-            ocr_text = pytesseract.image_to_string(image)
+            return pytesseract.image_to_string(image)
+            
+        try:
+            # Tesseract is CPU-bound and blocking; keep it off the event loop
+            ocr_text = await asyncio.to_thread(run_ocr)
             
             # Clean up the text
             ocr_text = ocr_text.strip()
@@ -691,7 +693,9 @@ class BrowserAutomation:
             
             # Get updated state
             dom_state = await self.get_current_dom_state()
-            screenshot = await self.take_screenshot()
+            # Keep the raw bytes for OCR; only the response needs base64
+            screenshot_bytes = await self.take_screenshot_bytes()
+            screenshot = base64.b64encode(screenshot_bytes).decode('utf-8') if screenshot_bytes else ""
             
             # Format elements for output
             elements = dom_state.element_tree.clickable_elements_to_string(
@@ -743,8 +747,8 @@ class BrowserAutomation:
             
             # Extract OCR text from screenshot if available
             ocr_text = ""
-            if screenshot:
-                ocr_text = await self.extract_ocr_text_from_screenshot(screenshot)
+            if screenshot_bytes:
+                ocr_text = await self.extract_ocr_text_from_screenshot(screenshot_bytes)
                 metadata['ocr_text'] = ocr_text
             
             print(f"Got updated state after {action_name}: {len(dom_state.selector_map)} elements")
@@ -106,7 +106,14 @@ def create_sandbox(password: str, project_id: str = None):
             "CHROME_USER_DATA": "",
             "CHROME_DEBUGGING_PORT": "9222",
             "CHROME_DEBUGGING_HOST": "localhost",
-            "CHROME_CDP": ""
+            "CHROME_CDP": "",
+            # Agent commands run without a TTY; never page git/man output
+            "PAGER": "cat",
+            "GIT_PAGER": "cat",
+            # Fail fast instead of hanging on credential prompts, and skip
+            # optional index refreshes/locks from background git calls
+            "GIT_TERMINAL_PROMPT": "0",
+            "GIT_OPTIONAL_LOCKS": "0"
         },
         resources={
             "cpu": 2,
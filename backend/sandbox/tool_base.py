@@ -1,5 +1,7 @@
 
-from typing import Optional
+import asyncio
+import time
+from typing import Dict, Optional, Tuple
 
 from agentpress.thread_manager import ThreadManager
 from agentpress.tool import Tool
@@ -13,6 +15,11 @@ class SandboxToolsBase(Tool):
     
     # Class variable to track if sandbox URLs have been printed
     _urls_printed = False
+
+    # Project sandbox info shared by every tool of a run:
+    # project_id -> (sandbox_id, sandbox_pass, expires_at)
+    _sandbox_info_cache: Dict[str, Tuple[str, Optional[str], float]] = {}
+    _SANDBOX_INFO_TTL = 60  # seconds
     
     def __init__(self, project_id: str, thread_manager: Optional[ThreadManager] = None):
         super().__init__()
@@ -22,28 +29,60 @@ class SandboxToolsBase(Tool):
         self._sandbox = None
         self._sandbox_id = None
         self._sandbox_pass = None
+        # Serializes first-time resolution when tool calls run in parallel
+        self._sandbox_lock = asyncio.Lock()
+
+    @classmethod
+    def _get_cached_sandbox_info(cls, project_id: str) -> Optional[Tuple[str, Optional[str]]]:
+        """Return cached (sandbox_id, sandbox_pass) for a project, evicting expired entries."""
+        now = time.monotonic()
+        # Sweep every expired entry so projects that never come back don't accumulate
+        expired = [pid for pid, info in cls._sandbox_info_cache.items() if info[2] <= now]
+        for pid in expired:
+            del cls._sandbox_info_cache[pid]
+
+        cached = cls._sandbox_info_cache.get(project_id)
+        if cached:
+            return cached[0], cached[1]
+        return None
 
     async def _ensure_sandbox(self) -> Sandbox:
         """Ensure we have a valid sandbox instance, retrieving it from the project if needed."""
-        if self._sandbox is None:
+        if self._sandbox is not None:
+            return self._sandbox
+
+        async with self._sandbox_lock:
+            # Another call may have resolved the sandbox while we waited
+            if self._sandbox is not None:
+                return self._sandbox
+
             try:
-                # Get database client
-                client = await self.thread_manager.db.client
-                
-                # Get project data
-                project = await client.table('projects').select('*').eq('project_id', self.project_id).execute()
-                if not project.data or len(project.data) == 0:
-                    raise ValueError(f"Project {self.project_id} not found")
-                
-                project_data = project.data[0]
-                sandbox_info = project_data.get('sandbox', {})
-                
-                if not sandbox_info.get('id'):
-                    raise ValueError(f"No sandbox found for project {self.project_id}")
-                
-                # Store sandbox info
-                self._sandbox_id = sandbox_info['id']
-                self._sandbox_pass = sandbox_info.get('pass')
+                cached = self._get_cached_sandbox_info(self.project_id)
+                if cached:
+                    self._sandbox_id, self._sandbox_pass = cached
+                else:
+                    # Get database client
+                    client = await self.thread_manager.db.client
+                    
+                    # Get project data
+                    project = await client.table('projects').select('*').eq('project_id', self.project_id).execute()
+                    if not project.data or len(project.data) == 0:
+                        raise ValueError(f"Project {self.project_id} not found")
+                    
+                    project_data = project.data[0]
+                    sandbox_info = project_data.get('sandbox', {})
+                    
+                    if not sandbox_info.get('id'):
+                        raise ValueError(f"No sandbox found for project {self.project_id}")
+                    
+                    # Store sandbox info
+                    self._sandbox_id = sandbox_info['id']
+                    self._sandbox_pass = sandbox_info.get('pass')
+                    SandboxToolsBase._sandbox_info_cache[self.project_id] = (
+                        self._sandbox_id,
+                        self._sandbox_pass,
+                        time.monotonic() + self._SANDBOX_INFO_TTL
+                    )
                 
                 # Get or start the sandbox
                 self._sandbox = await get_or_start_sandbox(self._sandbox_id)
@@ -63,6 +102,8 @@ class SandboxToolsBase(Tool):
                 #     SandboxToolsBase._urls_printed = True
                 
             except Exception as e:
+                # Drop possibly stale info so the next attempt re-reads the project
+                SandboxToolsBase._sandbox_info_cache.pop(self.project_id, None)
                 logger.error(f"Error retrieving sandbox for project {self.project_id}: {str(e)}", exc_info=True)
                 raise e
         
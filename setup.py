@@ -3,7 +3,9 @@ import os
 import sys
 import time
 import platform
+import shutil
 import subprocess
+import tempfile
 from getpass import getpass
 import re
 
@@ -70,21 +72,16 @@ def check_requirements():
     missing = []
     
     for cmd, url in requirements.items():
-        try:
-            # Check if python3/pip3 for Windows
-            if platform.system() == 'Windows' and cmd in ['python3', 'pip3']:
-                cmd_to_check = cmd.replace('3', '')
-            else:
-                cmd_to_check = cmd
-                
-            subprocess.run(
-                [cmd_to_check, '--version'],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                check=True
-            )
+        # Check if python3/pip3 for Windows
+        if platform.system() == 'Windows' and cmd in ['python3', 'pip3']:
+            cmd_to_check = cmd.replace('3', '')
+        else:
+            cmd_to_check = cmd
+        
+        # Look the executable up on PATH instead of spawning `<cmd> --version`
+        if shutil.which(cmd_to_check):
             print_success(f"{cmd} is installed")
-        except (subprocess.SubprocessError, FileNotFoundError):
+        else:
             missing.append((cmd, url))
             print_error(f"{cmd} is not installed")
     
@@ -404,6 +401,27 @@ def collect_rapidapi_keys():
         'RAPID_API_KEY': rapid_api_key,
     }
 
+def write_env_file(env_path, content):
+    """Write an env file atomically so an interrupted setup never leaves it half-written"""
+    env_dir = os.path.dirname(env_path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=env_dir, prefix='.env.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        # mkstemp creates the file as 0600; keep an existing file's mode, otherwise
+        # use what a plain open() would give a new file
+        if os.path.exists(env_path):
+            mode = os.stat(env_path).st_mode & 0o777
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, env_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
 def configure_backend_env(env_vars, use_docker=True):
     """Configure backend .env file"""
     env_path = os.path.join('backend', '.env')
@@ -510,8 +528,7 @@ ENV_MODE=local
     env_content += f"NEXT_PUBLIC_URL=http://localhost:3000\n"
     
     # Write to file
-    with open(env_path, 'w') as f:
-        f.write(env_content)
+    write_env_file(env_path, env_content)
     
     print_success(f"Backend .env file created at {env_path}")
     print_info(f"Redis host is set to: {redis_host}")
@@ -533,9 +550,7 @@ def configure_frontend_env(env_vars, use_docker=True):
     }
 
     # Write to file
-    with open(env_path, 'w') as f:
-        for key, value in config.items():
-            f.write(f"{key}={value}\n")
+    write_env_file(env_path, "".join(f"{key}={value}\n" for key, value in config.items()))
     
     print_success(f"Frontend .env.local file created at {env_path}")
     print_info(f"Backend URL is set to: {backend_url}")
@@ -545,14 +560,7 @@ def setup_supabase():
     print_info("Setting up Supabase database...")
     
     # Check if the Supabase CLI is installed
-    try:
-        subprocess.run(
-            ['supabase', '--version'],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            check=True
-        )
-    except (subprocess.SubprocessError, FileNotFoundError):
+    if not shutil.which('supabase'):
         print_error("Supabase CLI is not installed.")
         print_info("Please install it by following instructions at https://supabase.com/docs/guides/cli/getting-started")
         print_info("After installing, run this setup again")
@@ -564,7 +572,7 @@ def setup_supabase():
         # Get from main function if environment variable not set
         env_path = os.path.join('backend', '.env')
         if os.path.exists(env_path):
-            with open(env_path, 'r') as f:
+            with open(env_path, 'r', encoding='utf-8') as f:
                 for line in f:
                     if line.startswith('SUPABASE_URL='):
                         supabase_url = line.strip().split('=', 1)[1]